@@ -1,10 +1,16 @@
 from dotenv import load_dotenv
 import logging
+import asyncio
 import json
+import math
 import os
-from datetime import datetime
+import sqlite3
+from collections import deque
+from contextlib import closing
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup, KeyboardButton
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup, KeyboardButton, InputMediaPhoto, InputMediaDocument
+from telegram.error import RetryAfter
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters, ContextTypes
 import uuid
 
@@ -18,6 +24,11 @@ BOT_TOKEN = os.getenv("BOT_TOKEN")
 
 ADMIN_IDS = [int(x.strip()) for x in os.getenv("ADMIN_ID", "").split(",") if x.strip()]
 
+# Telegram accepts at most 10 items per media group
+MEDIA_GROUP_LIMIT = 10
+# Album items arrive as separate updates; wait this long after the last one
+ALBUM_DEBOUNCE_SECONDS = 1.5
+
 LANGUAGES = {
     'en': {
         'welcome': "🎉 Welcome to XV Dev Labs! 🚀\n\nWe're here to help you with your blockchain and development needs. How can we assist you today? Please choose an option below:",
@@ -46,6 +57,8 @@ LANGUAGES = {
         'language_changed': "✅ Language changed to English",
         'select_language': "🌍 Select your preferred language:",
         'collecting_messages': "📝 You can send multiple messages. Click 'Finish' when done.",
+        'draft_reminder': "⏰ You have an unfinished service request. Send more details or click 'Finish' to submit it.",
+        'draft_lost': "⌛ Your unfinished service request expired while our bot was restarting. Please open Services and describe your needs again.",
     },
     'ru': {
         'welcome': "🎉 Добро пожаловать в XV Dev Labs! 🚀\n\nМы здесь, чтобы помочь вам с вашими потребностями в блокчейне и разработке. Как мы можем помочь вам сегодня? Пожалуйста, выберите опцию ниже:",
@@ -74,6 +87,8 @@ LANGUAGES = {
         'language_changed': "✅ Язык изменен на русский",
         'select_language': "🌍 Выберите предпочитаемый язык:",
         'collecting_messages': "📝 Вы можете отправить несколько сообщений. Нажмите 'Завершить', когда закончите.",
+        'draft_reminder': "⏰ У вас есть незавершённый запрос на услугу. Отправьте больше деталей или нажмите 'Завершить', чтобы отправить его.",
+        'draft_lost': "⌛ Ваш незавершённый запрос на услугу был утерян при перезапуске бота. Пожалуйста, откройте 'Услуги' и опишите ваши потребности снова.",
     },
     'ar': {
         'welcome': "🎉 مرحباً بكم في XV Dev Labs! 🚀\n\nنحن هنا لمساعدتكم في احتياجاتكم من البلوك تشين والتطوير. كيف يمكننا مساعدتكم اليوم؟ يرجى اختيار خيار أدناه:",
@@ -102,6 +117,8 @@ LANGUAGES = {
         'language_changed': "✅ تم تغيير اللغة إلى العربية",
         'select_language': "🌍 اختر لغتك المفضلة:",
         'collecting_messages': "📝 يمكنك إرسال عدة رسائل. انقر 'إنهاء' عند الانتهاء.",
+        'draft_reminder': "⏰ لديك طلب خدمة غير مكتمل. أرسل المزيد من التفاصيل أو انقر 'إنهاء' لإرساله.",
+        'draft_lost': "⌛ انتهت صلاحية طلب الخدمة غير المكتمل أثناء إعادة تشغيل البوت. يرجى فتح الخدمات ووصف احتياجاتك مرة أخرى.",
     },
     'fa': {
         'welcome': "🎉 به XV Dev Labs خوش آمدید! 🚀\n\nما اینجا هستیم تا در نیازهای بلاک‌چین و توسعه شما کمک کنیم. امروز چگونه می‌توانیم به شما کمک کنیم؟ لطفاً یکی از گزینه‌های زیر را انتخاب کنید:",
@@ -130,6 +147,8 @@ LANGUAGES = {
         'language_changed': "✅ زبان به فارسی تغییر کرد",
         'select_language': "🌍 زبان مورد نظر خود را انتخاب کنید:",
         'collecting_messages': "📝 می‌توانید چندین پیام ارسال کنید. وقتی تمام کردید 'پایان' را کلیک کنید.",
+        'draft_reminder': "⏰ شما یک درخواست خدمت ناتمام دارید. جزئیات بیشتری ارسال کنید یا برای ارسال آن 'پایان' را کلیک کنید.",
+        'draft_lost': "⌛ درخواست خدمت ناتمام شما هنگام راه‌اندازی مجدد ربات از بین رفت. لطفاً بخش خدمات را باز کرده و نیازهای خود را دوباره توضیح دهید.",
     },
     'de': {
         'welcome': "🎉 Willkommen bei XV Dev Labs! 🚀\n\nWir sind hier, um Ihnen bei Ihren Blockchain- und Entwicklungsbedürfnissen zu helfen. Wie können wir Ihnen heute helfen? Bitte wählen Sie eine Option unten:",
@@ -158,6 +177,8 @@ LANGUAGES = {
         'language_changed': "✅ Sprache auf Deutsch geändert",
         'select_language': "🌍 Wählen Sie Ihre bevorzugte Sprache:",
         'collecting_messages': "📝 Sie können mehrere Nachrichten senden. Klicken Sie 'Fertig', wenn Sie fertig sind.",
+        'draft_reminder': "⏰ Sie haben eine unvollständige Serviceanfrage. Senden Sie weitere Details oder klicken Sie 'Fertig', um sie abzuschicken.",
+        'draft_lost': "⌛ Ihre unvollständige Serviceanfrage ist beim Neustart unseres Bots verloren gegangen. Bitte öffnen Sie 'Dienstleistungen' und beschreiben Sie Ihre Anforderungen erneut.",
     },
     'fr': {
         'welcome': "🎉 Bienvenue chez XV Dev Labs! 🚀\n\nNous sommes là pour vous aider avec vos besoins en blockchain et développement. Comment pouvons-nous vous aider aujourd'hui? Veuillez choisir une option ci-dessous:",
@@ -186,12 +207,518 @@ LANGUAGES = {
         'language_changed': "✅ Langue changée en français",
         'select_language': "🌍 Sélectionnez votre langue préférée:",
         'collecting_messages': "📝 Vous pouvez envoyer plusieurs messages. Cliquez 'Terminer' quand vous avez fini.",
+        'draft_reminder': "⏰ Vous avez une demande de service inachevée. Envoyez plus de détails ou cliquez 'Terminer' pour la soumettre.",
+        'draft_lost': "⌛ Votre demande de service inachevée a expiré lors du redémarrage de notre bot. Veuillez ouvrir 'Services' et décrire à nouveau vos besoins.",
     }
 }
 
 USER_STATES = {}
 USER_PREFERENCES = {}
-PROJECTS = {} 
+PROJECTS = {}
+PENDING_ALBUMS = {}
+ALBUM_TASKS = set()
+
+ANALYTICS_FILE = os.getenv("ANALYTICS_FILE", "analytics.json")
+ANALYTICS_SAVE_SECONDS = 60
+ANALYTICS_RETENTION_DAYS = 90
+REPORT_PERIODS = {'day': 1, 'week': 7, 'month': 30, 'quarter': 90}
+
+class Analytics:
+    """Streaming aggregates for demand and response times.
+
+    Everything is updated in O(1) when an event happens, so reports never scan
+    history: lifetime counters, one rollup per day (pruned after
+    ANALYTICS_RETENTION_DAYS) and a log-bucketed latency sketch per rollup.
+    The aggregates are small, so they are snapshotted to ANALYTICS_FILE every
+    ANALYTICS_SAVE_SECONDS and on shutdown.
+    """
+
+    # Relative error of the time-to-first-reply quantiles (~5%).
+    SKETCH_GAMMA = 1.1
+
+    def __init__(self, path: str = ANALYTICS_FILE):
+        self.path = path
+        self.totals = {}
+        self.daily = {}
+        self.total_sketch = {}
+        self.pending_since = {}
+        self.dirty = False
+        self.task = None
+
+    def _day_bucket(self, when: datetime) -> Dict:
+        day = when.date().toordinal()
+        bucket = self.daily.get(day)
+        if bucket is None:
+            bucket = {'counts': {}, 'sketch': {}}
+            self.daily[day] = bucket
+            for old_day in [d for d in self.daily if d <= day - ANALYTICS_RETENTION_DAYS]:
+                del self.daily[old_day]
+        return bucket
+
+    def _sketch_index(self, seconds: float) -> int:
+        return int(math.ceil(math.log(max(seconds, 1.0), self.SKETCH_GAMMA)))
+
+    def _sketch_value(self, index: int) -> float:
+        # Midpoint of the bucket (gamma^(i-1), gamma^i]
+        return 2 * self.SKETCH_GAMMA ** index / (self.SKETCH_GAMMA + 1)
+
+    def increment(self, event: str, when: Optional[datetime] = None):
+        when = when or datetime.now()
+        counts = self._day_bucket(when)['counts']
+        counts[event] = counts.get(event, 0) + 1
+        self.totals[event] = self.totals.get(event, 0) + 1
+        self.dirty = True
+
+    def record_failed(self, event: str):
+        """Count a request that reached no admin; it does not start the reply clock."""
+        self.increment(f'{event}_failed')
+
+    def record_inbound(self, user_id: int, event: str):
+        """Count an inbound request and start the reply clock for the user."""
+        now = datetime.now()
+        self.increment(event, now)
+        self.pending_since.setdefault(user_id, now)
+
+    def record_reply(self, user_id: int):
+        """Count an admin reply; the first one after a request feeds the sketch."""
+        now = datetime.now()
+        self.increment('replies', now)
+        asked_at = self.pending_since.pop(user_id, None)
+        if asked_at is None:
+            return
+
+        index = self._sketch_index((now - asked_at).total_seconds())
+        sketch = self._day_bucket(now)['sketch']
+        sketch[index] = sketch.get(index, 0) + 1
+        self.total_sketch[index] = self.total_sketch.get(index, 0) + 1
+
+    def snapshot(self) -> Dict:
+        # JSON object keys must be strings
+        return {
+            'totals': dict(self.totals),
+            'total_sketch': {str(k): v for k, v in self.total_sketch.items()},
+            'daily': {
+                str(day): {
+                    'counts': dict(bucket['counts']),
+                    'sketch': {str(k): v for k, v in bucket['sketch'].items()},
+                }
+                for day, bucket in self.daily.items()
+            },
+            'pending_since': {str(uid): when.isoformat() for uid, when in self.pending_since.items()},
+        }
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            totals = {str(k): int(v) for k, v in data['totals'].items()}
+            total_sketch = {int(k): int(v) for k, v in data['total_sketch'].items()}
+            daily = {
+                int(day): {
+                    'counts': {str(k): int(v) for k, v in bucket['counts'].items()},
+                    'sketch': {int(k): int(v) for k, v in bucket['sketch'].items()},
+                }
+                for day, bucket in data['daily'].items()
+            }
+            pending_since = {int(uid): datetime.fromisoformat(when) for uid, when in data['pending_since'].items()}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.error(f"Failed to load analytics from {self.path}: {e}")
+            return
+
+        first_day = datetime.now().date().toordinal() - ANALYTICS_RETENTION_DAYS + 1
+        self.totals = totals
+        self.total_sketch = total_sketch
+        self.daily = {day: bucket for day, bucket in daily.items() if day >= first_day}
+        self.pending_since = pending_since
+        logger.info(f"Loaded analytics for {len(self.daily)} days")
+
+    def write(self, snapshot: Dict):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"Failed to save analytics to {self.path}: {e}")
+
+    async def save(self):
+        if not self.dirty:
+            return
+        # Copy on the event loop, write the file off it
+        snapshot = self.snapshot()
+        self.dirty = False
+        await asyncio.to_thread(self.write, snapshot)
+
+    async def run_autosave(self):
+        while True:
+            await asyncio.sleep(ANALYTICS_SAVE_SECONDS)
+            await self.save()
+
+    def start(self):
+        self.load()
+        self.task = asyncio.create_task(self.run_autosave())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+        await self.save()
+
+    def quantile(self, sketch: Dict[int, int], q: float) -> Optional[float]:
+        total = sum(sketch.values())
+        if not total:
+            return None
+
+        # Nearest-rank, so p99 of a small sample is its slowest reply
+        rank = max(1, math.ceil(q * total))
+        seen = 0
+        for index in sorted(sketch):
+            seen += sketch[index]
+            if seen >= rank:
+                return self._sketch_value(index)
+        return self._sketch_value(max(sketch))
+
+    def summary(self, days: Optional[int] = None) -> Dict:
+        """Merge the last `days` daily rollups, or return lifetime totals."""
+        if days is None:
+            counts, sketch = dict(self.totals), dict(self.total_sketch)
+        else:
+            counts, sketch = {}, {}
+            first_day = datetime.now().date().toordinal() - days + 1
+            for day, bucket in self.daily.items():
+                if day < first_day:
+                    continue
+                for event, value in bucket['counts'].items():
+                    counts[event] = counts.get(event, 0) + value
+                for index, value in bucket['sketch'].items():
+                    sketch[index] = sketch.get(index, 0) + value
+
+        return {
+            'counts': counts,
+            'answered': sum(sketch.values()),
+            'awaiting_reply': len(self.pending_since),
+            'p50': self.quantile(sketch, 0.5),
+            'p90': self.quantile(sketch, 0.9),
+            'p99': self.quantile(sketch, 0.99),
+        }
+
+ANALYTICS = Analytics()
+
+def format_duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "n/a"
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f}m"
+    if seconds < 86400:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / 86400:.1f}d"
+
+SCHEDULER_FILE = os.getenv("SCHEDULER_FILE", "scheduled_reminders.db")
+STALE_PROJECT_HOURS = float(os.getenv("STALE_PROJECT_HOURS", "48"))
+DRAFT_NUDGE_HOURS = float(os.getenv("DRAFT_NUDGE_HOURS", "24"))
+STATUS_DIGEST_DAYS = float(os.getenv("STATUS_DIGEST_DAYS", "7"))
+# Stay under Telegram's ~30 messages/second global bot limit
+REMINDER_MESSAGES_PER_SECOND = float(os.getenv("REMINDER_MESSAGES_PER_SECOND", "25"))
+FINAL_PROJECT_STATUSES = {'completed', 'done', 'delivered', 'cancelled', 'canceled', 'closed'}
+
+class Timer:
+    __slots__ = ('key', 'due', 'kind', 'payload', 'level', 'slot')
+
+    def __init__(self, key: str, due: int, kind: str, payload: Dict):
+        self.key = key
+        self.due = due
+        self.kind = kind
+        self.payload = payload
+        self.level = None
+        self.slot = None
+
+class TimerWheel:
+    """Hierarchical timer wheel with O(1) schedule and cancel.
+
+    Time is measured in integer ticks. Level 0 holds timers due within the
+    next SLOTS ticks, level 1 within SLOTS**2 ticks, and so on; when a lower
+    level wraps around, the matching slot of the level above is cascaded
+    down. Timers are addressed by a caller-chosen key, so scheduling an
+    existing key replaces it.
+    """
+
+    SLOT_BITS = 6
+    SLOTS = 1 << SLOT_BITS
+    LEVELS = 4
+
+    def __init__(self, current_tick: int):
+        self.current_tick = current_tick
+        self.wheels = [[{} for _ in range(self.SLOTS)] for _ in range(self.LEVELS)]
+        self.timers = {}
+
+    def __len__(self) -> int:
+        return len(self.timers)
+
+    def _place(self, timer: Timer, expired: List[Timer]):
+        delta = timer.due - self.current_tick
+        if delta <= 0:
+            timer.level = timer.slot = None
+            expired.append(timer)
+            return
+
+        max_delta = (1 << (self.SLOT_BITS * self.LEVELS)) - 1
+        due = self.current_tick + min(delta, max_delta)
+        level = 0
+        while level < self.LEVELS - 1 and delta >= 1 << (self.SLOT_BITS * (level + 1)):
+            level += 1
+
+        timer.level = level
+        timer.slot = (due >> (self.SLOT_BITS * level)) & (self.SLOTS - 1)
+        self.wheels[level][timer.slot][timer.key] = timer
+
+    def schedule(self, key: str, due: int, kind: str, payload: Dict) -> List[Timer]:
+        """Add or replace a timer; returns it in a list if it is already due."""
+        self.cancel(key)
+        timer = Timer(key, due, kind, payload)
+        expired = []
+        self._place(timer, expired)
+        if expired:
+            return expired
+        self.timers[key] = timer
+        return []
+
+    def cancel(self, key: str) -> bool:
+        timer = self.timers.pop(key, None)
+        if timer is None:
+            return False
+        del self.wheels[timer.level][timer.slot][key]
+        return True
+
+    def advance(self, to_tick: int) -> List[Timer]:
+        """Move the wheel forward to `to_tick` and return the expired timers."""
+        expired = []
+        while self.current_tick < to_tick:
+            self.current_tick += 1
+
+            # Cascade from the top so re-placed timers never land in a slot
+            # that has already been processed for this tick.
+            for level in range(self.LEVELS - 1, 0, -1):
+                if self.current_tick & ((1 << (self.SLOT_BITS * level)) - 1):
+                    continue
+                slot = (self.current_tick >> (self.SLOT_BITS * level)) & (self.SLOTS - 1)
+                cascading = self.wheels[level][slot]
+                self.wheels[level][slot] = {}
+                for timer in cascading.values():
+                    self._place(timer, expired)
+
+            slot = self.current_tick & (self.SLOTS - 1)
+            due_now = self.wheels[0][slot]
+            self.wheels[0][slot] = {}
+            expired.extend(due_now.values())
+
+        for timer in expired:
+            self.timers.pop(timer.key, None)
+        return expired
+
+class ReminderScheduler:
+    """Drives a TimerWheel from a single asyncio task.
+
+    Expired timers are turned into messages by the handler registered for
+    their kind, and a second task drains those messages through a token
+    bucket, so no per-timer tasks are ever created. Schedule/cancel calls are
+    coalesced per key and written to the sqlite database at SCHEDULER_FILE
+    once per tick, off the event loop, so persistence cost scales with the
+    number of changed timers rather than the number of pending ones.
+    """
+
+    TICK_SECONDS = 60
+
+    def __init__(self, path: str = SCHEDULER_FILE, messages_per_second: float = REMINDER_MESSAGES_PER_SECOND):
+        if messages_per_second <= 0:
+            raise ValueError(f"REMINDER_MESSAGES_PER_SECOND must be positive, got {messages_per_second}")
+        self.path = path
+        self.messages_per_second = messages_per_second
+        self.wheel = TimerWheel(self._tick_for(datetime.now().timestamp()))
+        self.handlers = {}
+        self.outbox = deque()
+        self.outbox_ready = None
+        self.pending_on_start = []
+        # key -> (due, kind, payload) to upsert, or None to delete
+        self.changes = {}
+        self.tasks = []
+
+    def _tick_for(self, timestamp: float) -> int:
+        return int(timestamp // self.TICK_SECONDS)
+
+    def _record(self, timer: Timer):
+        self.changes[timer.key] = (timer.due * self.TICK_SECONDS, timer.kind, timer.payload)
+
+    def register(self, kind: str, handler):
+        """`handler(payload)` returns a list of (chat_id, text) to send."""
+        self.handlers[kind] = handler
+
+    def schedule_in(self, key: str, seconds: float, kind: str, payload: Dict):
+        due = self._tick_for(datetime.now().timestamp() + seconds)
+        expired = self.wheel.schedule(key, due, kind, payload)
+        if expired:
+            self.changes[key] = None
+            self._dispatch(expired)
+        else:
+            self._record(self.wheel.timers[key])
+
+    def update_payload(self, key: str, payload: Dict):
+        """Replace a pending timer's payload without moving its due time"""
+        timer = self.wheel.timers.get(key)
+        if timer is not None:
+            timer.payload = payload
+            self._record(timer)
+
+    def is_scheduled(self, key: str) -> bool:
+        return key in self.wheel.timers
+
+    def cancel(self, key: str):
+        if self.wheel.cancel(key):
+            self.changes[key] = None
+
+    def _dispatch(self, timers: List[Timer]):
+        for timer in timers:
+            handler = self.handlers.get(timer.kind)
+            if handler is None:
+                logger.warning(f"No handler for reminder kind {timer.kind}")
+                continue
+            try:
+                self.outbox.extend(handler(timer.payload))
+            except Exception as e:
+                logger.error(f"Reminder {timer.key} failed: {e}")
+        if self.outbox and self.outbox_ready:
+            self.outbox_ready.set()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS timers "
+            "(key TEXT PRIMARY KEY, due REAL NOT NULL, kind TEXT NOT NULL, payload TEXT NOT NULL)"
+        )
+        return conn
+
+    def _read_rows(self) -> List:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT key, due, kind, payload FROM timers").fetchall()
+
+    def _write_changes(self, changes: Dict) -> bool:
+        upserts, deletes = [], []
+        for key, entry in changes.items():
+            if entry is None:
+                deletes.append((key,))
+            else:
+                due, kind, payload = entry
+                upserts.append((key, due, kind, json.dumps(payload)))
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany("INSERT OR REPLACE INTO timers VALUES (?, ?, ?, ?)", upserts)
+                conn.executemany("DELETE FROM timers WHERE key = ?", deletes)
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Failed to save reminders to {self.path}: {e}")
+            return False
+
+    async def load(self):
+        try:
+            rows = await asyncio.to_thread(self._read_rows)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to load reminders from {self.path}: {e}")
+            return
+
+        expired = []
+        skipped = 0
+        for row in rows:
+            try:
+                key, due, kind, payload = row
+                payload = json.loads(payload)
+                if not isinstance(key, str) or not isinstance(kind, str) or not isinstance(payload, dict):
+                    raise TypeError("unexpected column types")
+                due_tick = self._tick_for(float(due))
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Skipping invalid reminder {row[0]!r}: {e}")
+                self.changes[row[0]] = None
+                skipped += 1
+                continue
+            expired.extend(self.wheel.schedule(key, due_tick, kind, payload))
+
+        # Reminders that came due while the bot was down fire on the first tick
+        for timer in expired:
+            self.changes[timer.key] = None
+        self.pending_on_start = expired
+        logger.info(f"Loaded {len(rows) - skipped} reminders ({skipped} invalid skipped)")
+
+    async def flush(self):
+        if not self.changes:
+            return
+        changes, self.changes = self.changes, {}
+        saved = False
+        try:
+            saved = await asyncio.to_thread(self._write_changes, changes)
+        finally:
+            if not saved:
+                # Retry next tick; changes made since the swap are newer and win
+                for key, entry in changes.items():
+                    self.changes.setdefault(key, entry)
+
+    async def run_wheel(self):
+        self._dispatch(self.pending_on_start)
+        self.pending_on_start = []
+        while True:
+            now = datetime.now().timestamp()
+            await asyncio.sleep(self.TICK_SECONDS - now % self.TICK_SECONDS)
+            try:
+                expired = self.wheel.advance(self._tick_for(datetime.now().timestamp()))
+                # Handlers may re-arm the same key, so deletions are recorded first
+                for timer in expired:
+                    self.changes[timer.key] = None
+                self._dispatch(expired)
+                await self.flush()
+            except Exception as e:
+                logger.exception(f"Reminder tick failed: {e}")
+
+    async def run_sender(self, bot):
+        interval = 1 / self.messages_per_second
+        while True:
+            if not self.outbox:
+                self.outbox_ready.clear()
+                await self.outbox_ready.wait()
+            item = self.outbox.popleft()
+            try:
+                chat_id, text = item
+                await bot.send_message(chat_id, text)
+            except RetryAfter as e:
+                # Newer python-telegram-bot versions report a timedelta
+                retry_after = e.retry_after
+                if isinstance(retry_after, timedelta):
+                    retry_after = retry_after.total_seconds()
+                logger.warning(f"Rate limited sending reminders, retrying in {retry_after}s")
+                self.outbox.appendleft(item)
+                await asyncio.sleep(retry_after)
+                continue
+            except Exception as e:
+                logger.error(f"Failed to send reminder {item!r}: {e}")
+            await asyncio.sleep(interval)
+
+    async def start(self, bot):
+        self.outbox_ready = asyncio.Event()
+        await self.load()
+        self.tasks = [
+            asyncio.create_task(self.run_wheel()),
+            asyncio.create_task(self.run_sender(bot)),
+        ]
+
+    async def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        await self.flush()
+
+SCHEDULER = ReminderScheduler()
 
 class XVDevLabsBot:
     
@@ -202,11 +729,13 @@ class XVDevLabsBot:
 
     def set_user_language(self, user_id: int, language: str):
         if user_id not in USER_PREFERENCES:
-            USER_PREFERENCES[user_id] = {'language': 'en', 'current_messages': []}
+            USER_PREFERENCES[user_id] = {'language': 'en', 'current_messages': [], 'current_attachments': []}
         USER_PREFERENCES[user_id]['language'] = language
 
     def get_text(self, user_id: int, key: str) -> str:
-        lang = self.get_user_language(user_id)
+        return self.get_text_for_language(self.get_user_language(user_id), key)
+
+    def get_text_for_language(self, lang: str, key: str) -> str:
         return LANGUAGES.get(lang, LANGUAGES['en']).get(key, LANGUAGES['en'][key])
 
     def create_main_keyboard(self, user_id: int) -> InlineKeyboardMarkup:
@@ -263,14 +792,249 @@ class XVDevLabsBot:
 
     def save_user_messages(self, user_id: int, messages: List[str]):
         if user_id not in USER_PREFERENCES:
-            USER_PREFERENCES[user_id] = {'language': 'en', 'current_messages': []}
+            USER_PREFERENCES[user_id] = {'language': 'en', 'current_messages': [], 'current_attachments': []}
         USER_PREFERENCES[user_id]['current_messages'] = messages
 
     def get_user_messages(self, user_id: int) -> List[str]:
         return USER_PREFERENCES.get(user_id, {}).get('current_messages', [])
 
+    def save_user_attachments(self, user_id: int, attachments: List[Dict]):
+        if user_id not in USER_PREFERENCES:
+            USER_PREFERENCES[user_id] = {'language': 'en', 'current_messages': [], 'current_attachments': []}
+        USER_PREFERENCES[user_id]['current_attachments'] = attachments
+
+    def get_user_attachments(self, user_id: int) -> List[Dict]:
+        return USER_PREFERENCES.get(user_id, {}).get('current_attachments', [])
+
     def clear_user_messages(self, user_id: int):
         self.save_user_messages(user_id, [])
+        self.save_user_attachments(user_id, [])
+
+    def get_message_attachments(self, message) -> List[Dict]:
+        """Return the Telegram file ids attached to a message (nothing is downloaded)"""
+        if message.photo:
+            # Sizes are ordered smallest to largest
+            return [{'type': 'photo', 'file_id': message.photo[-1].file_id}]
+        if message.document:
+            return [{'type': 'document', 'file_id': message.document.file_id}]
+        return []
+
+    async def send_attachments(self, bot, chat_id: int, attachments: List[Dict]):
+        """Re-send attachments by file_id, batching them into media groups.
+
+        Photos and documents cannot be mixed in one album, so each type is
+        chunked separately.
+        """
+        media_types = {'photo': InputMediaPhoto, 'document': InputMediaDocument}
+        single_senders = {'photo': bot.send_photo, 'document': bot.send_document}
+
+        for media_type, media_class in media_types.items():
+            file_ids = [a['file_id'] for a in attachments if a['type'] == media_type]
+            for i in range(0, len(file_ids), MEDIA_GROUP_LIMIT):
+                chunk = file_ids[i:i + MEDIA_GROUP_LIMIT]
+                if len(chunk) == 1:
+                    await single_senders[media_type](chat_id, chunk[0])
+                else:
+                    await bot.send_media_group(chat_id, [media_class(file_id) for file_id in chunk])
+
+    async def forward_to_admins(self, bot, admin_text: str, attachments: List[Dict], log_label: str) -> bool:
+        """Send a request to every admin; True if at least one admin got the text"""
+        message_sent = False
+        for admin_id in ADMIN_IDS:
+            try:
+                await bot.send_message(admin_id, admin_text)
+                message_sent = True
+                logger.info(f"{log_label} sent to admin {admin_id}")
+            except Exception as e:
+                logger.error(f"Failed to send {log_label.lower()} to admin {admin_id}: {e}")
+                continue
+
+            if attachments:
+                try:
+                    await self.send_attachments(bot, admin_id, attachments)
+                except Exception as e:
+                    logger.error(f"Failed to send {log_label.lower()} attachments to admin {admin_id}: {e}")
+        return message_sent
+
+    async def deliver_request(self, bot, request: Dict):
+        """Forward a question/support request to the admins and confirm to the user"""
+        user_id = request['user_id']
+        admin_text = request['header'] + "\n".join(request['texts'])
+        if request['attachments']:
+            admin_text += f"\n📎 Attachments: {len(request['attachments'])}"
+        admin_text += request['footer']
+
+        message_sent = await self.forward_to_admins(bot, admin_text, request['attachments'], request['label'])
+
+        if message_sent:
+            ANALYTICS.record_inbound(user_id, request['event'])
+        else:
+            ANALYTICS.record_failed(request['event'])
+
+        confirmation = request['sent_text'] if message_sent else request['failed_text']
+        keyboard = self.create_main_keyboard(user_id)
+        await bot.send_message(user_id, confirmation, reply_markup=keyboard)
+
+    async def submit_request(self, update: Update, context: ContextTypes.DEFAULT_TYPE, request: Dict):
+        """Deliver a request now, or buffer it while the rest of its album arrives"""
+        USER_STATES.pop(request['user_id'], None)
+        media_group_id = update.message.media_group_id
+        if not media_group_id:
+            await self.deliver_request(context.bot, request)
+            return
+
+        request['kind'] = 'request'
+        self.start_album(context.bot, media_group_id, request)
+
+    def start_album(self, bot, media_group_id: str, entry: Dict):
+        entry['last_seen'] = asyncio.get_running_loop().time()
+        PENDING_ALBUMS[media_group_id] = entry
+        entry['task'] = asyncio.create_task(self.flush_album(bot, media_group_id))
+        ALBUM_TASKS.add(entry['task'])
+        entry['task'].add_done_callback(ALBUM_TASKS.discard)
+
+    def touch_album(self, media_group_id: str):
+        PENDING_ALBUMS[media_group_id]['last_seen'] = asyncio.get_running_loop().time()
+
+    def add_to_pending_album(self, media_group_id: str, text: str, attachments: List[Dict]):
+        request = PENDING_ALBUMS[media_group_id]
+        if text:
+            request['texts'].append(text)
+        request['attachments'].extend(attachments)
+        self.touch_album(media_group_id)
+
+    async def flush_album(self, bot, media_group_id: str):
+        loop = asyncio.get_running_loop()
+        while True:
+            wait = PENDING_ALBUMS[media_group_id]['last_seen'] + ALBUM_DEBOUNCE_SECONDS - loop.time()
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+
+        await self.finish_album(bot, media_group_id, PENDING_ALBUMS.pop(media_group_id))
+
+    async def finish_album(self, bot, media_group_id: str, entry: Dict):
+        try:
+            if entry['kind'] == 'request':
+                await self.deliver_request(bot, entry)
+            else:
+                await self.confirm_draft(bot, entry['user_id'])
+        except Exception as e:
+            logger.error(f"Failed to deliver album {media_group_id}: {e}")
+
+    async def flush_pending_albums(self, bot):
+        """Deliver albums still waiting out the debounce, e.g. on shutdown"""
+        pending = list(PENDING_ALBUMS.items())
+        PENDING_ALBUMS.clear()
+        for _, entry in pending:
+            entry['task'].cancel()
+        # Albums already past the debounce are mid-delivery; let them finish
+        await asyncio.gather(*ALBUM_TASKS, return_exceptions=True)
+        for media_group_id, entry in pending:
+            await self.finish_album(bot, media_group_id, entry)
+
+    async def confirm_draft(self, bot, user_id: int):
+        state = USER_STATES.get(user_id)
+        if not state or not state.startswith('service_description_'):
+            return
+
+        messages = self.get_user_messages(user_id)
+        attachments = self.get_user_attachments(user_id)
+        confirmation = f"✅ Message added ({len(messages)} messages, {len(attachments)} attachments)! Send more details or click 'Finish' when done."
+        keyboard = self.create_finish_back_keyboard(user_id)
+        await bot.send_message(user_id, confirmation, reply_markup=keyboard)
+
+    def register_reminders(self):
+        SCHEDULER.register('stale_project', self.stale_project_reminder)
+        SCHEDULER.register('draft_nudge', self.draft_nudge_reminder)
+        SCHEDULER.register('status_digest', self.status_digest_reminder)
+
+    def project_reminder_payload(self, project: Dict) -> Dict:
+        # Reminders outlive PROJECTS across restarts, so they carry a copy of
+        # what they need to render.
+        return {
+            'project_id': project['id'],
+            'client_id': project['client_id'],
+            'service_type': project['service_type'],
+            'status': project['status'],
+            'updated_at': project['updated_at'],
+        }
+
+    def schedule_project_reminders(self, project_id: str):
+        """(Re)arm reminders after activity on a project, or drop them once it is final"""
+        project = PROJECTS.get(project_id)
+        if not project or project['status'].lower() in FINAL_PROJECT_STATUSES:
+            SCHEDULER.cancel(f'stale:{project_id}')
+            SCHEDULER.cancel(f'digest:{project_id}')
+            return
+
+        payload = self.project_reminder_payload(project)
+        SCHEDULER.schedule_in(f'stale:{project_id}', STALE_PROJECT_HOURS * 3600, 'stale_project', payload)
+        if SCHEDULER.is_scheduled(f'digest:{project_id}'):
+            SCHEDULER.update_payload(f'digest:{project_id}', payload)
+        else:
+            SCHEDULER.schedule_in(f'digest:{project_id}', STATUS_DIGEST_DAYS * 86400, 'status_digest', payload)
+
+    def stale_project_reminder(self, payload: Dict) -> List:
+        project = PROJECTS.get(payload['project_id'])
+        if project is None:
+            # The bot restarted and the project is gone from memory: alert
+            # once with the last known state instead of repeating.
+            text = f"⚠️ Project no longer loaded (bot restarted), last known state:\n"
+            project = payload
+        elif project['status'].lower() in FINAL_PROJECT_STATUSES:
+            return []
+        else:
+            # Keep nagging every STALE_PROJECT_HOURS until someone touches it
+            self.schedule_project_reminders(project['id'])
+            text = f"⏰ Stale project!\n"
+
+        text += f"🆔 Project ID: {payload['project_id']}\n👤 Client ID: {project['client_id']}\n"
+        text += f"🔧 Service: {project['service_type']}\n📊 Status: {project['status']}\n🔄 Last update: {project['updated_at']}"
+        return [(admin_id, text) for admin_id in ADMIN_IDS]
+
+    def draft_nudge_payload(self, user_id: int) -> Dict:
+        return {'user_id': user_id, 'language': self.get_user_language(user_id)}
+
+    def draft_nudge_reminder(self, payload: Dict) -> List:
+        user_id = payload['user_id']
+        if user_id not in USER_PREFERENCES:
+            # Drafts live in memory; after a restart tell the user to start over
+            return [(user_id, self.get_text_for_language(payload.get('language', 'en'), 'draft_lost'))]
+
+        state = USER_STATES.get(user_id)
+        if not state or not state.startswith('service_description_'):
+            return []
+        return [(user_id, self.get_text(user_id, 'draft_reminder'))]
+
+    def status_digest_reminder(self, payload: Dict) -> List:
+        project = PROJECTS.get(payload['project_id'])
+        if project is None:
+            # Send the last known state once; there is nothing live to follow
+            project = payload
+        elif project['status'].lower() in FINAL_PROJECT_STATUSES:
+            return []
+        else:
+            SCHEDULER.schedule_in(
+                f"digest:{project['id']}", STATUS_DIGEST_DAYS * 86400, 'status_digest',
+                self.project_reminder_payload(project)
+            )
+
+        text = f"📋 Project Status Digest:\n🆔 ID: {payload['project_id']}\n🔧 Service: {project['service_type']}\n"
+        text += f"📊 Status: {project['status']}\n🔄 Updated: {project['updated_at']}"
+        return [(project['client_id'], text)]
+
+    async def post_init(self, application: Application):
+        ANALYTICS.start()
+        await SCHEDULER.start(application.bot)
+
+    async def post_stop(self, application: Application):
+        # The bot is still usable here, unlike in post_shutdown
+        await self.flush_pending_albums(application.bot)
+
+    async def post_shutdown(self, application: Application):
+        await SCHEDULER.stop()
+        await ANALYTICS.stop()
 
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         user_id = update.effective_user.id
@@ -291,6 +1055,7 @@ class XVDevLabsBot:
         if data == 'back_to_main':
             USER_STATES.pop(user_id, None)
             self.clear_user_messages(user_id)
+            SCHEDULER.cancel(f'draft:{user_id}')
             await self.start(update, context)
             
         elif data == 'ask_question':
@@ -343,6 +1108,7 @@ class XVDevLabsBot:
             
             USER_STATES[user_id] = f'service_description_{service_type}'
             self.clear_user_messages(user_id)
+            SCHEDULER.schedule_in(f'draft:{user_id}', DRAFT_NUDGE_HOURS * 3600, 'draft_nudge', self.draft_nudge_payload(user_id))
             
             text = self.get_text(user_id, 'describe_needs').format(service_names.get(service_type, service_type))
             text += f"\n\n{self.get_text(user_id, 'collecting_messages')}"
@@ -351,18 +1117,21 @@ class XVDevLabsBot:
             
         elif data == 'finish_service':
             messages = self.get_user_messages(user_id)
-            if messages:
+            attachments = self.get_user_attachments(user_id)
+            if messages or attachments:
+                service_type = USER_STATES.get(user_id, '').replace('service_description_', '')
                 admin_text = f"🆕 New service request from user {user_id}:\n"
-                admin_text += f"Service: {USER_STATES.get(user_id, '').replace('service_description_', '')}\n"
+                admin_text += f"Service: {service_type}\n"
                 admin_text += f"Messages:\n" + "\n".join(f"• {msg}" for msg in messages)
-        
-                for admin_id in ADMIN_IDS:
-                    try:
-                        await context.bot.send_message(admin_id, admin_text)
-                    except Exception as e:
-                        logger.error(f"Failed to send to admin {admin_id}: {e}")
-        
+                if attachments:
+                    admin_text += f"\n📎 Attachments: {len(attachments)}"
+
+                if await self.forward_to_admins(context.bot, admin_text, attachments, "Service request"):
+                    ANALYTICS.record_inbound(user_id, f'service_{service_type}')
+                else:
+                    ANALYTICS.record_failed(f'service_{service_type}')
                 self.clear_user_messages(user_id)
+                SCHEDULER.cancel(f'draft:{user_id}')
                 USER_STATES.pop(user_id, None)
         
                 text = self.get_text(user_id, 'thanks_contact')
@@ -371,37 +1140,38 @@ class XVDevLabsBot:
 
     async def message_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         user_id = update.effective_user.id
-        message_text = update.message.text
+        message_text = update.message.text or update.message.caption or ""
+        attachments = self.get_message_attachments(update.message)
+        media_group_id = update.message.media_group_id
         
         state = USER_STATES.get(user_id)
+
+        # Later items of an album whose first item started a question or
+        # support request are collected and sent together with it.
+        if media_group_id in PENDING_ALBUMS and PENDING_ALBUMS[media_group_id]['kind'] == 'request':
+            self.add_to_pending_album(media_group_id, message_text, attachments)
+            return
         
         if state == 'asking_question':
             username = update.effective_user.username or "No username"
             first_name = update.effective_user.first_name or "Unknown"
             
-            admin_text = f"❓ NEW QUESTION\n"
-            admin_text += f"👤 User: {first_name} (@{username})\n"
-            admin_text += f"🆔 User ID: {user_id}\n"
-            admin_text += f"💬 Question:\n{message_text}\n\n"
-            admin_text += f"Reply with: /reply {user_id} your_message"
-            
-            message_sent = False
-            for admin_id in ADMIN_IDS:
-                try:
-                    await context.bot.send_message(admin_id, admin_text)
-                    message_sent = True
-                    logger.info(f"Question sent to admin {admin_id}")
-                except Exception as e:
-                    logger.error(f"Failed to send question to admin {admin_id}: {e}")
+            header = f"❓ NEW QUESTION\n"
+            header += f"👤 User: {first_name} (@{username})\n"
+            header += f"🆔 User ID: {user_id}\n"
+            header += f"💬 Question:\n"
             
-            if message_sent:
-                confirmation = "✅ Your question has been sent to our team. We'll get back to you soon!"
-            else:
-                confirmation = "❌ Sorry, there was an issue sending your question. Please try again later."
-                
-            keyboard = self.create_main_keyboard(user_id)
-            await update.message.reply_text(confirmation, reply_markup=keyboard)
-            USER_STATES.pop(user_id, None)
+            await self.submit_request(update, context, {
+                'user_id': user_id,
+                'label': "Question",
+                'event': 'questions',
+                'header': header,
+                'texts': [message_text] if message_text else [],
+                'footer': f"\n\nReply with: /reply {user_id} your_message",
+                'attachments': attachments,
+                'sent_text': "✅ Your question has been sent to our team. We'll get back to you soon!",
+                'failed_text': "❌ Sorry, there was an issue sending your question. Please try again later.",
+            })
             
         elif state == 'support_enter_id':
             if self.is_valid_project_id(message_text.strip()):
@@ -436,42 +1206,45 @@ class XVDevLabsBot:
             
         elif state and state.startswith('service_description_'):
             messages = self.get_user_messages(user_id)
-            messages.append(message_text)
-            self.save_user_messages(user_id, messages)
-            
-            confirmation = f"✅ Message added ({len(messages)} total)! Send more details or click 'Finish' when done."
-            keyboard = self.create_finish_back_keyboard(user_id)
-            await update.message.reply_text(confirmation, reply_markup=keyboard)
+            if message_text:
+                messages.append(message_text)
+                self.save_user_messages(user_id, messages)
+
+            draft_attachments = self.get_user_attachments(user_id)
+            draft_attachments.extend(attachments)
+            self.save_user_attachments(user_id, draft_attachments)
+            SCHEDULER.schedule_in(f'draft:{user_id}', DRAFT_NUDGE_HOURS * 3600, 'draft_nudge', self.draft_nudge_payload(user_id))
+
+            # Confirm an album once, after its last item has arrived
+            if media_group_id in PENDING_ALBUMS:
+                self.touch_album(media_group_id)
+            elif media_group_id:
+                self.start_album(context.bot, media_group_id, {'kind': 'draft', 'user_id': user_id})
+            else:
+                await self.confirm_draft(context.bot, user_id)
             
         elif state and state.startswith('support_project_'):
             project_id = state.replace('support_project_', '')
             username = update.effective_user.username or "No username"
             first_name = update.effective_user.first_name or "Unknown"
             
-            admin_text = f"🛠️ SUPPORT REQUEST\n"
-            admin_text += f"👤 User: {first_name} (@{username})\n"
-            admin_text += f"🆔 User ID: {user_id}\n"
-            admin_text += f"📋 Project ID: {project_id}\n"
-            admin_text += f"💬 Message:\n{message_text}\n\n"
-            admin_text += f"Reply with: /reply {user_id} your_message"
-            
-            message_sent = False
-            for admin_id in ADMIN_IDS:
-                try:
-                    await context.bot.send_message(admin_id, admin_text)
-                    message_sent = True
-                    logger.info(f"Support request sent to admin {admin_id}")
-                except Exception as e:
-                    logger.error(f"Failed to send support request to admin {admin_id}: {e}")
+            header = f"🛠️ SUPPORT REQUEST\n"
+            header += f"👤 User: {first_name} (@{username})\n"
+            header += f"🆔 User ID: {user_id}\n"
+            header += f"📋 Project ID: {project_id}\n"
+            header += f"💬 Message:\n"
             
-            if message_sent:
-                confirmation = "✅ Your support request has been sent to our team. We'll assist you soon!"
-            else:
-                confirmation = "❌ Sorry, there was an issue sending your request. Please try again later."
-                
-            keyboard = self.create_main_keyboard(user_id)
-            await update.message.reply_text(confirmation, reply_markup=keyboard)
-            USER_STATES.pop(user_id, None)
+            await self.submit_request(update, context, {
+                'user_id': user_id,
+                'label': "Support request",
+                'event': 'support_requests',
+                'header': header,
+                'texts': [message_text] if message_text else [],
+                'footer': f"\n\nReply with: /reply {user_id} your_message",
+                'attachments': attachments,
+                'sent_text': "✅ Your support request has been sent to our team. We'll assist you soon!",
+                'failed_text': "❌ Sorry, there was an issue sending your request. Please try again later.",
+            })
 
     async def admin_broadcast(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Broadcast message to all users who have interacted with the bot"""
@@ -520,6 +1293,7 @@ class XVDevLabsBot:
             reply_text = f"💬 Response from XV Dev Labs Team:\n\n{message}"
             
             await context.bot.send_message(user_id, reply_text)
+            ANALYTICS.record_reply(user_id)
             await update.message.reply_text(f"✅ Reply sent to user {user_id}")
             
         except ValueError:
@@ -554,6 +1328,7 @@ class XVDevLabsBot:
                     'created_at': datetime.now().isoformat(),
                     'updated_at': datetime.now().isoformat()
                 }
+                self.schedule_project_reminders(project_id)
                 
                 await update.message.reply_text(
                     f"✅ Project created!\n🆔 Project ID: {project_id}\n👤 Client ID: {client_id}\n🔧 Service: {service_type}"
@@ -595,6 +1370,7 @@ class XVDevLabsBot:
             if project_id in PROJECTS:
                 PROJECTS[project_id]['status'] = new_status
                 PROJECTS[project_id]['updated_at'] = datetime.now().isoformat()
+                self.schedule_project_reminders(project_id)
             
             await update.message.reply_text(f"✅ Project {project_id} status updated to: {new_status}")
             
@@ -631,6 +1407,9 @@ class XVDevLabsBot:
             
             try:
                 await context.bot.send_message(client_id, notification)
+                # An update to the client counts as activity for stale alerts
+                project['updated_at'] = datetime.now().isoformat()
+                self.schedule_project_reminders(project_id)
                 await update.message.reply_text(f"✅ Update sent to client {client_id}")
             except Exception as e:
                 logger.error(f"Failed to send update to client {client_id}: {e}")
@@ -654,6 +1433,37 @@ class XVDevLabsBot:
                 
             await update.message.reply_text(text)
 
+    async def admin_report(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        if update.effective_user.id not in ADMIN_IDS:
+            return
+
+        period = context.args[0].lower() if context.args else 'week'
+        if period != 'all' and period not in REPORT_PERIODS:
+            await update.message.reply_text(
+                f"Usage: /report [{'|'.join(list(REPORT_PERIODS) + ['all'])}]"
+            )
+            return
+
+        summary = ANALYTICS.summary(REPORT_PERIODS.get(period))
+        counts = {k: v for k, v in summary['counts'].items() if not k.endswith('_failed')}
+        failed = sum(v for k, v in summary['counts'].items() if k.endswith('_failed'))
+
+        text = f"📈 Report ({period}):\n\n"
+        text += f"❓ Questions: {counts.get('questions', 0)}\n"
+        text += f"🛠️ Support requests: {counts.get('support_requests', 0)}\n"
+        text += f"💼 Service requests: {sum(v for k, v in counts.items() if k.startswith('service_'))}\n"
+        for event in sorted(k for k in counts if k.startswith('service_')):
+            text += f"   • {event.replace('service_', '')}: {counts[event]}\n"
+        text += f"💬 Admin replies: {counts.get('replies', 0)}\n"
+        if failed:
+            text += f"⚠️ Not delivered to any admin: {failed}\n"
+        text += "\n"
+        text += f"⏱️ Time to first reply ({summary['answered']} answered):\n"
+        text += f"   p50: {format_duration(summary['p50'])} | p90: {format_duration(summary['p90'])} | p99: {format_duration(summary['p99'])}\n"
+        text += f"⏳ Awaiting reply now: {summary['awaiting_reply']}"
+
+        await update.message.reply_text(text)
+
     async def admin_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if update.effective_user.id not in ADMIN_IDS:
             return
@@ -679,6 +1489,9 @@ class XVDevLabsBot:
         /reply <user_id> <message>
         - Reply to a specific user
 
+        /report [day|week|month|quarter|all]
+        - Show demand and response-time report
+
         /admin_help
         - Show this help message
                 """
@@ -686,12 +1499,20 @@ class XVDevLabsBot:
 
 def main():
     bot = XVDevLabsBot()
+    bot.register_reminders()
     
-    application = Application.builder().token(BOT_TOKEN).build()
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .post_init(bot.post_init)
+        .post_stop(bot.post_stop)
+        .post_shutdown(bot.post_shutdown)
+        .build()
+    )
     
     application.add_handler(CommandHandler("start", bot.start))
     application.add_handler(CallbackQueryHandler(bot.button_handler))
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot.message_handler))
+    application.add_handler(MessageHandler((filters.TEXT | filters.PHOTO | filters.Document.ALL) & ~filters.COMMAND, bot.message_handler))
     
     application.add_handler(CommandHandler("create_project", bot.admin_create_project))
     application.add_handler(CommandHandler("update_status", bot.admin_update_status))
@@ -700,6 +1521,7 @@ def main():
     application.add_handler(CommandHandler("admin_help", bot.admin_help))
     application.add_handler(CommandHandler("reply", bot.admin_reply))
     application.add_handler(CommandHandler("broadcast", bot.admin_broadcast))
+    application.add_handler(CommandHandler("report", bot.admin_report))
     
     print("🚀 XV Dev Labs Bot starting...")
     application.run_polling()
@@ -0,0 +1,109 @@
+import asyncio
+import random
+import sqlite3
+
+import pytest
+
+pytest.importorskip("telegram")
+pytest.importorskip("dotenv")
+
+from main import ReminderScheduler, TimerWheel
+
+
+class SmallWheel(TimerWheel):
+    # 2 levels of 4 slots: a 16-tick span, so cascades and overflow are cheap to reach
+    SLOT_BITS = 2
+    SLOTS = 4
+    LEVELS = 2
+
+
+def fired_keys(wheel, to_tick):
+    return sorted(t.key for t in wheel.advance(to_tick))
+
+
+def test_timers_fire_exactly_on_their_tick_across_cascades():
+    wheel = SmallWheel(current_tick=5)
+    deltas = [1, 3, 4, 5, 11, 15]
+    for delta in deltas:
+        wheel.schedule(f"t{delta}", 5 + delta, "kind", {})
+
+    for tick in range(6, 21):
+        expected = [f"t{tick - 5}"] if tick - 5 in deltas else []
+        assert fired_keys(wheel, tick) == expected
+    assert len(wheel) == 0
+
+
+def test_deadline_past_wheel_span_is_held_until_due():
+    wheel = SmallWheel(current_tick=0)
+    wheel.schedule("far", 100, "kind", {})
+
+    assert fired_keys(wheel, 99) == []
+    assert fired_keys(wheel, 100) == ["far"]
+
+
+def test_randomized_against_brute_force():
+    rng = random.Random(1)
+    wheel = SmallWheel(current_tick=3)
+    pending = {}
+    for _ in range(300):
+        key = f"k{rng.randrange(50)}"
+        if rng.random() < 0.2:
+            assert wheel.cancel(key) == (key in pending)
+            pending.pop(key, None)
+            continue
+
+        due = wheel.current_tick + rng.randrange(-2, 60)
+        pending.pop(key, None)
+        if not wheel.schedule(key, due, "kind", {}):
+            pending[key] = due
+
+        target = wheel.current_tick + rng.randrange(4)
+        expected = sorted(k for k, d in pending.items() if d <= target)
+        assert fired_keys(wheel, target) == expected
+        for k in expected:
+            del pending[k]
+        assert len(wheel) == len(pending)
+
+
+def test_cancel_and_reschedule():
+    wheel = TimerWheel(current_tick=0)
+    wheel.schedule("a", 10, "kind", {})
+    assert wheel.cancel("a")
+    assert not wheel.cancel("a")
+    assert fired_keys(wheel, 20) == []
+
+    wheel.schedule("b", 30, "kind", {})
+    wheel.schedule("b", 25, "kind", {"moved": True})
+    fired = wheel.advance(30)
+    assert [(t.key, t.due, t.payload) for t in fired] == [("b", 25, {"moved": True})]
+
+    assert [t.key for t in wheel.schedule("late", 10, "kind", {})] == ["late"]
+
+
+def test_sqlite_reload_fires_overdue_and_skips_invalid(tmp_path):
+    path = str(tmp_path / "reminders.db")
+    scheduler = ReminderScheduler(path)
+    scheduler.schedule_in("future", 3600, "kind", {"n": 1})
+    scheduler.schedule_in("overdue", 3600, "kind", {"n": 2})
+    asyncio.run(scheduler.flush())
+
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE timers SET due = 60 WHERE key = 'overdue'")
+        conn.execute("INSERT INTO timers VALUES ('invalid', 120, 'kind', 'not json')")
+
+    reloaded = ReminderScheduler(path)
+    asyncio.run(reloaded.load())
+
+    assert reloaded.is_scheduled("future")
+    assert reloaded.wheel.timers["future"].payload == {"n": 1}
+    assert [t.key for t in reloaded.pending_on_start] == ["overdue"]
+    assert not reloaded.is_scheduled("invalid")
+
+    asyncio.run(reloaded.flush())
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT key FROM timers").fetchall() == [("future",)]
+
+
+def test_non_positive_send_rate_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ReminderScheduler(str(tmp_path / "reminders.db"), messages_per_second=0)